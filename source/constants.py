@@ -94,12 +94,16 @@ def _generate_id_types() -> dict[str, IDType]:
 
 
 def get_id_type(id_data: bpy.types.ID) -> str:
-    id_type = getattr(id_data, 'type', '')
+
+    # Checking the class avoids `getattr`'s slower exception-based default handling.
+    id_type = id_data.type if hasattr(type(id_data), 'type') else ''
 
     if id_type != (k := id_data.id_type):
         id_type += f'_{k}' if id_type else k
 
-    return id_type if id_type in ID_TYPES else 'UNDEFINED'
+    return id_type if id_type in _ID_TYPE_KEYS else 'UNDEFINED'
 
 
 ID_TYPES = _generate_id_types()
+_ID_TYPE_KEYS = frozenset(ID_TYPES)
+OBJECT_DATA_TYPES = frozenset(k for k, v in ID_TYPES.items() if v.is_object_data)
@@ -21,7 +21,13 @@ def register() -> None:
     for cls in classes():
         bpy.utils.register_class(cls)
 
+    from . import find_similar
+    find_similar.register_handlers()
+
 
 def unregister() -> None:
+    from . import find_similar
+    find_similar.unregister_handlers()
+
     for cls in classes():
         bpy.utils.unregister_class(cls)
@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Collection, Iterable, Iterator, Sequence
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
-from functools import cached_property
-from itertools import chain, groupby, product, zip_longest
+from functools import lru_cache
+from itertools import chain, groupby, product
 from math import floor, sqrt
 from operator import itemgetter
 from statistics import fmean
 from typing import Any, cast
 
 import bpy
-import networkx as nx
 from bpy.types import Context, Event, Node, NodeLink, NodeSocket, NodeTree, Operator
 
 from ..constants import ID_TYPES, get_id_type
 from ..properties import DBU_PG_FindSimilarSettings
 
+# networkx and scipy are imported lazily: they are only needed once an operator actually runs,
+# and importing them at addon register noticeably slows down Blender startup.
+
+
+@lru_cache(maxsize=1)
+def _assignment_solver() -> tuple[Any, Any] | None:
+    try:
+        import numpy as np
+        from scipy.optimize import linear_sum_assignment
+    except ImportError:
+        return None
+
+    return np, linear_sum_assignment
+
 
 def get_settings() -> DBU_PG_FindSimilarSettings:
     return bpy.context.scene.dbu_similar_settings  # type: ignore
@@ -28,72 +42,143 @@ def is_local_id(id_data: bpy.types.ID) -> bool:
     return not id_data.library and not id_data.override_library
 
 
-def get_invalid_nodes(ntree: NodeTree) -> set[Node]:
-    settings = get_settings()
+def get_invalid_nodes(ntree: NodeTree, settings: DBU_PG_FindSimilarSettings) -> set[Node]:
     invalid_nodes = set()
 
     if settings.exclude_organization:
-        invalid_nodes.update([
-          n for n in ntree.nodes if n.bl_idname in {'NodeReroute', 'NodeFrame'}])
+        invalid_nodes.update([n for n in ntree.nodes if n.bl_idname in _ORG_TYPES])
 
     if settings.exclude_unused:
-        G = nx.DiGraph([(l.from_node, l.to_node) for l in ntree.links])
-        G.add_nodes_from(ntree.nodes)
+        preds = defaultdict(list)
+        for l in ntree.links:
+            preds[l.to_node].append(l.from_node)
 
-        output_nodes = [n for n in G if not n.outputs and G.pred[n]]
-        used_nodes = chain(*[nx.ancestors(G, n) for n in output_nodes], output_nodes)
-        invalid_nodes.update(set(G).difference(used_nodes) | {n for n in G if n.mute})
+        # Reverse BFS from the output nodes; everything not reached is unused.
+        used_nodes = {n for n in ntree.nodes if not n.outputs and n in preds}
+        queue = deque(used_nodes)
+        while queue:
+            for p in preds[queue.popleft()]:
+                if p not in used_nodes:
+                    used_nodes.add(p)
+                    queue.append(p)
+
+        invalid_nodes.update(n for n in ntree.nodes if n not in used_nodes or n.mute)
 
     return invalid_nodes
 
 
-def get_precomputed_root_link(link: NodeLink, links: dict[NodeSocket, NodeLink]) -> NodeLink:
-    if link.from_node.bl_idname != 'NodeReroute':
-        return link
+def resolve_root_links(links: dict[NodeSocket, NodeLink]) -> dict[NodeSocket, NodeLink]:
 
-    try:
-        prev_link = links[link.from_node.inputs[0]]
-    except (IndexError, KeyError):
-        return link
+    # Walking every chain from scratch costs `O(K * M)` for a reroute chain of length K with M
+    # consumers; caching the root of each visited link makes it `O(K + M)`.
+
+    resolved: dict[NodeLink, NodeLink] = {}
+    root_links = {}
+    for socket, link in links.items():
+        visited = []
+        while link.from_node.bl_idname == 'NodeReroute':
+            if (root := resolved.get(link)) is not None:
+                link = root
+                break
+
+            visited.append(link)
+            try:
+                prev_link = links[link.from_node.inputs[0]]
+            except (IndexError, KeyError):
+                break
 
-    return get_precomputed_root_link(prev_link, links) if prev_link.is_valid else link
+            if not prev_link.is_valid:
+                break
+
+            link = prev_link
+
+        for l in visited:
+            resolved[l] = link
+
+        root_links[socket] = link
+
+    return root_links
 
 
 def get_root_link(link: NodeLink) -> NodeLink:
-    if link.from_node.bl_idname != 'NodeReroute':
-        return link
+    while link.from_node.bl_idname == 'NodeReroute':
+        if not (links := link.from_node.inputs[0].links):
+            break
 
-    if links := link.from_node.inputs[0].links:
         prev_link = links[0]
-    else:
-        return link
+        if not prev_link.is_valid:
+            break
+
+        link = prev_link
+
+    return link
+
+
+_SENTINEL = object()
+_PROP_ARR = bpy.types.bpy_prop_array
+
+# Inline set literals are rebuilt on every evaluation; these run per node or per socket.
+_ORG_TYPES = frozenset({'NodeReroute', 'NodeFrame'})
+_SHADER_GEOMETRY = frozenset({'SHADER', 'GEOMETRY'})
+_SCALAR_OUT_NODES = frozenset({'ShaderNodeValue', 'ShaderNodeRGB', 'ShaderNodeNormal'})
+_MULTI_FRAME_SOURCES = frozenset({'SEQUENCE', 'MOVIE'})
 
-    return get_root_link(prev_link) if prev_link.is_valid else link
+
+def freeze(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return tuple(map(freeze, value))
+
+    return value
 
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     from_socket_idx: int
     linked_props: NodeProperties
 
-    @cached_property
-    def reduced_props(self) -> tuple[int, list[Any]]:
-        return (self.from_socket_idx, [p for p in self.linked_props if not isinstance(p, Link)])
+    # Computed lazily: the linked node's props may still be incomplete when the Link is created.
+    _reduced: tuple[int, tuple[Any, ...]] | None = field(default=None, init=False)
+    _hash: int | None = field(default=None, init=False)
+
+    @property
+    def reduced_props(self) -> tuple[int, tuple[Any, ...]]:
+        if (reduced := self._reduced) is None:
+            reduced = self._reduced = (
+              self.from_socket_idx,
+              tuple(freeze(p) for p in self.linked_props if not isinstance(p, Link)))
+
+        return reduced
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Link) and self.reduced_props == other.reduced_props
+        return isinstance(other, Link) and (
+          hash(self) == hash(other) and self.reduced_props == other.reduced_props)
 
+    def __hash__(self) -> int:
+        if (h := self._hash) is None:
+            h = self._hash = hash(self.reduced_props)
 
-def get_non_socket_prop_names(node: Node) -> tuple[str, ...]:
-    if not node.is_registered_node_type():
-        return ()
+        return h
+
+
+_SKIP_PROPS = frozenset({'color_mapping', 'texture_mapping', 'image_user', 'lightmixer'})
 
-    node_type = type(node)
+
+@lru_cache(maxsize=None)
+def _non_socket_prop_names(node_type: type[Node]) -> tuple[str, ...]:
     node_props = set(node_type.bl_rna.properties.keys())
     parent_props = set(node_type.__mro__[1].bl_rna.properties.keys())  # type: ignore
     return tuple(node_props - parent_props)
 
 
+def get_non_socket_prop_names(node: Node) -> tuple[str, ...]:
+    if not node.is_registered_node_type():
+        return ()
+
+    return _non_socket_prop_names(type(node))
+
+
 def get_image_props(img: bpy.types.Image) -> tuple[Any, ...]:
     return (
       img.filepath,
@@ -126,13 +211,26 @@ def get_light_props(light: bpy.types.Light) -> tuple[Any, ...]:
 class NodeProperties:
     id_data: Node | NodeTree
     props: list[Link | Any] = field(default_factory=list)
+    sig: tuple[Any, ...] = ()
+    sig_hash: int = 0
+    counter: Counter[Any] = field(default_factory=Counter)
 
     def __post_init__(self) -> None:
         if isinstance(self.id_data, Node):
             self.props.extend((self.id_data.bl_idname, self.id_data.mute))
 
+    def finalize(self) -> None:
+        self.sig = tuple(freeze(p) for p in self.props)
+        self.sig_hash = hash(self.sig)
+        self.counter = Counter(self.sig[1:])
+
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, NodeProperties) and self.props == other.props
+        return isinstance(other, NodeProperties) and (
+          self.sig is other.sig
+          or (self.sig_hash == other.sig_hash and self.sig == other.sig))
+
+    def __hash__(self) -> int:
+        return self.sig_hash
 
     def __iter__(self) -> Iterator[Any]:
         return iter(self.props)
@@ -140,47 +238,47 @@ class NodeProperties:
     def __len__(self) -> int:
         return len(self.props)
 
-    def _add_link(self, link: NodeLink, node_map: dict[str, NodeProperties]) -> None:
-        i = int(link.from_socket.path_from_id()[-2:-1])
-        self.props.append(Link(i, node_map[link.from_node.name]))
-
     def add_inputs(
       self,
       links: dict[NodeSocket, NodeLink],
       node_map: dict[str, NodeProperties],
+      socket_idx: dict[NodeSocket, int],
     ) -> None:
         node = self.id_data
 
         if not isinstance(node, Node):
             return
 
-        props = self.props
+        # This runs per socket across every node; bind the hot lookups once.
+        append = self.props.append
         for socket in node.inputs:
             if socket.is_linked:
                 if socket.is_multi_input:
                     assert socket.links is not None
                     for link in socket.links:
                         root_link = get_root_link(link)
-                        if not root_link.from_node.mute:
-                            self._add_link(root_link, node_map)
+                        from_node = root_link.from_node
+                        if not from_node.mute:
+                            append(Link(socket_idx[root_link.from_socket],
+                              node_map[from_node.name]))
                     continue
 
-                from_node = links[socket].from_node
+                link = links[socket]
+                from_node = link.from_node
                 if not from_node.mute and from_node.name in node_map:
-                    self._add_link(links[socket], node_map)
+                    append(Link(socket_idx[link.from_socket], node_map[from_node.name]))
                     continue
 
-            if socket.hide_value or socket.type in {'SHADER', 'GEOMETRY'}:
-                props.append((socket.bl_idname, socket.name))
+            if socket.hide_value or socket.type in _SHADER_GEOMETRY:
+                append((socket.bl_idname, socket.name))
                 continue
 
-            try:
-                props.append(socket.default_value)  # type: ignore
-            except AttributeError:
-                continue
+            value = getattr(socket, 'default_value', _SENTINEL)
+            if value is not _SENTINEL:
+                append(value)
 
-        if node.bl_idname in {'ShaderNodeValue', 'ShaderNodeRGB', 'ShaderNodeNormal'}:
-            props.append(node.outputs[0].default_value)  # type: ignore
+        if node.bl_idname in _SCALAR_OUT_NODES:
+            append(node.outputs[0].default_value)  # type: ignore
 
     def add_other_props(self) -> None:
         node = self.id_data
@@ -195,7 +293,7 @@ class NodeProperties:
 
         props = self.props
         for prop_name in non_socket_props:
-            if prop_name in {'color_mapping', 'texture_mapping', 'image_user', 'lightmixer'}:
+            if prop_name in _SKIP_PROPS:
                 continue
 
             # yapf: disable
@@ -222,7 +320,7 @@ class NodeProperties:
                   *elm_positions))
             elif isinstance(prop, bpy.types.Image):
                 props.extend(get_image_props(prop))
-                if prop.source in {'SEQUENCE', 'MOVIE'}:
+                if prop.source in _MULTI_FRAME_SOURCES:
                     img_user: bpy.types.ImageUser = node.image_user # type: ignore
                     props.extend((
                       img_user.frame_duration,
@@ -235,9 +333,16 @@ class NodeProperties:
             # yapf: enable
 
 
+# Extracted contents per data-block name, keyed against a fingerprint so unchanged trees are
+# reused across back-to-back runs (e.g. find -> merge -> find). The depsgraph handler below and
+# the fingerprint guard against stale entries.
+_CONTENT_CACHE: dict[str, tuple[tuple[Any, ...], list[NodeProperties]]] = {}
+
+
 def contents_of_ntrees(
   bl_data: Iterable[NodeTree | bpy.types.Material | bpy.types.Light]
 ) -> defaultdict[str, list[NodeProperties]]:
+    settings = get_settings()
     content_map = defaultdict(list)
     for id_data in bl_data:
         if not is_local_id(id_data) or (not isinstance(id_data, NodeTree) and not id_data.use_nodes):
@@ -246,22 +351,46 @@ def contents_of_ntrees(
         ntree = id_data if isinstance(id_data, NodeTree) else id_data.node_tree
         assert ntree is not None
 
+        fp = (
+          ntree.as_pointer(),
+          len(ntree.nodes),
+          len(ntree.links),
+          settings.exclude_unused,
+          settings.exclude_organization,
+        )
+        cached = _CONTENT_CACHE.get(id_data.name)
+        if cached is not None and cached[0] == fp:
+            content_map[id_data.name] = cached[1]
+            continue
+
         # Precompute links to avoid `O(len(ntree.links))` time
         links = {l.to_socket: l for l in ntree.links}
-        root_links = {i: get_precomputed_root_link(l, links) for i, l in links.items()}
+        root_links = resolve_root_links(links)
         contents = content_map[id_data.name]
+        _CONTENT_CACHE[id_data.name] = (fp, contents)
 
-        invalid_nodes = get_invalid_nodes(ntree)
+        invalid_nodes = get_invalid_nodes(ntree, settings)
         node_map = {n.name: NodeProperties(n) for n in ntree.nodes if n not in invalid_nodes}
+        socket_idx = {s: i for n in ntree.nodes for i, s in enumerate(n.outputs)}
         for props in node_map.values():
-            props.add_inputs(root_links, node_map)
+            props.add_inputs(root_links, node_map, socket_idx)
             props.add_other_props()
-            props.props = [
-              tuple(p) if isinstance(p, bpy.types.bpy_prop_array) else p for p in props]
+
+            # Convert in place; rebuilding the list copies every element just to swap a few.
+            lst = props.props
+            for i, p in enumerate(lst):
+                if isinstance(p, _PROP_ARR):
+                    lst[i] = tuple(p)
+
+        # Freeze in a second pass so no Link is hashed before its linked node is complete.
+        for props in node_map.values():
+            props.finalize()
             contents.append(props)
 
         if isinstance(id_data, bpy.types.Light) and bpy.app.version >= (5, 1, 0):
-            contents.append(NodeProperties(id_data, ['LIGHT PROPS', *get_light_props(id_data)]))
+            light_props = NodeProperties(id_data, ['LIGHT PROPS', *get_light_props(id_data)])
+            light_props.finalize()
+            contents.append(light_props)
 
         if not isinstance(id_data, NodeTree):
             continue
@@ -270,21 +399,31 @@ def contents_of_ntrees(
           (i.bl_socket_idname, i.name)
           for i in id_data.interface.items_tree
           if isinstance(i, bpy.types.NodeTreeInterfaceSocket)]
-        contents.append(NodeProperties(ntree, ['TREE SOCKETS'] + tree_sockets))
+        socket_props = NodeProperties(ntree, ['TREE SOCKETS'] + tree_sockets)
+        socket_props.finalize()
+        contents.append(socket_props)
 
     return content_map
 
 
-_SENTINEL = object()
+def pair_nodes(nodes1: Sequence[NodeProperties], nodes2: Sequence[NodeProperties]) -> int:
+    if (solver := _assignment_solver()) is not None:
+        np, linear_sum_assignment = solver
+        scores = np.zeros((len(nodes1), len(nodes2)), dtype=np.int32)
+        for i, props1 in enumerate(nodes1):
+            cnt1 = props1.counter
+            for j, props2 in enumerate(nodes2):
+                scores[i, j] = sum((cnt1 & props2.counter).values())
 
+        ri, ci = linear_sum_assignment(scores, maximize=True)
+        return int(scores[ri, ci].sum())
 
-def pair_nodes(nodes1: Collection[NodeProperties], nodes2: Collection[NodeProperties]) -> int:
     diff_map = {}
     for props1 in nodes1:
-        props1_len = len(props1.props[1:])
+        cnt1 = props1.counter
+        props1_len = len(props1.sig) - 1
         for props2 in nodes2:
-            zipped = zip_longest(props1.props[1:], props2.props[1:], fillvalue=_SENTINEL)
-            dot = sum([1 for a, b in zipped if a == b])
+            dot = sum((cnt1 & props2.counter).values())
             diff_map[(props1.id_data, props2.id_data)] = (props1_len - dot, dot)
 
     sums = []
@@ -297,64 +436,100 @@ def pair_nodes(nodes1: Collection[NodeProperties], nodes2: Collection[NodeProper
     return sum(sums)
 
 
-def cosine_similarity(A: list[NodeProperties], B: list[NodeProperties]) -> float:
-
-    # Nodes from A are compared with nodes from B of the same type. The most similar are paired
-    # together, and their dot product is returned in `pair_nodes()`.
-
+def group_by_type(contents: list[NodeProperties]) -> dict[str, list[NodeProperties]]:
     bl_idname = lambda p: p.props[0]
-    A.sort(key=bl_idname)
-    B.sort(key=bl_idname)
+    contents.sort(key=bl_idname)
+    return {t: list(g) for t, g in groupby(contents, bl_idname)}
 
-    if A == B:
-        return 1
 
-    ntypes1 = {t1: list(g1) for t1, g1 in groupby(A, bl_idname)}
-    ntypes2 = {t2: list(g2) for t2, g2 in groupby(B, bl_idname)}
+def cosine_similarity(
+  ntypes1: dict[str, list[NodeProperties]],
+  ntypes2: dict[str, list[NodeProperties]],
+  magnitude1: int,
+  magnitude2: int,
+  threshold: float = 0,
+) -> float:
 
-    s1 = sum([len(p1) - 1 for p1 in A])
-    s2 = sum([pair_nodes(g1, ntypes2[t1]) for t1, g1 in ntypes1.items() if t1 in ntypes2])
+    # Nodes from the first set are compared with nodes from the second of the same type. The most
+    # similar are paired together, and their dot product is returned in `pair_nodes()`.
 
-    try:
-        return s2 / sqrt(s1 * s2)
-    except ZeroDivisionError:
+    norm = sqrt(magnitude1 * magnitude2)
+    if norm == 0:
         return 0
 
+    # Each shared bucket can contribute at most the smaller of its two total prop counts. Walking
+    # buckets largest-first lets most negative comparisons bail out after one or two buckets.
+    shared = []
+    for t1, g1 in ntypes1.items():
+        if (g2 := ntypes2.get(t1)) is not None:
+            potential = min(
+              sum([len(p.sig) - 1 for p in g1]), sum([len(p.sig) - 1 for p in g2]))
+            shared.append((potential, g1, g2))
+
+    shared.sort(key=itemgetter(0), reverse=True)
+
+    dot = 0
+    remaining = sum([potential for potential, *_ in shared])
+    for potential, g1, g2 in shared:
+        remaining -= potential
+        dot += pair_nodes(g1, g2)
+        if (dot + remaining) / norm < threshold:
+            return 0
+
+    return dot / norm
+
 
 _Scores = dict[tuple[str, str], float]
 
 
 def find_similar(contents: dict[str, list[NodeProperties]], results: _Scores) -> None:
-    items = contents.items()
-    seen = set()
     threshold = get_settings().similarity_threshold
-    for k1, A in items:
-        for k2, B in items:
-            if {k1, k2} in seen or k1 == k2:
+    ratio_threshold = threshold - 0.14
+
+    # To avoid as many `cosine_similarity()` calls as possible, only compare pairs without large
+    # differences in length. Sorting by length makes the valid partners of each item a
+    # contiguous window found by bisection.
+    keys = sorted(contents, key=lambda k: len(contents[k]))
+    sizes = [len(contents[k]) for k in keys]
+    ntypes = {k: group_by_type(contents[k]) for k in keys}
+    magnitudes = {k: sum([len(p) - 1 for p in contents[k]]) for k in keys}
+
+    # A single int compare rules out identical contents on the common "not identical" path; only
+    # matching hashes pay for the full multiset equality check.
+    counters = {k: Counter(contents[k]) for k in keys}
+    hashes = {k: hash(frozenset(c.items())) for k, c in counters.items()}
+
+    for i, k1 in enumerate(keys):
+        lo = bisect_left(sizes, ratio_threshold * sizes[i], 0, i)
+        for j in range(lo, i):
+            k2 = keys[j]
+
+            if hashes[k1] == hashes[k2] and counters[k1] == counters[k2]:
+                results[(k1, k2)] = 1
                 continue
 
-            seen.add(frozenset((k1, k2)))
-            smallest, largest = sorted((A, B), key=lambda c: sum([len(p) - 1 for p in c]))
-
-            # To avoid as many `cosine_similarity()` calls as possible, check for large
-            # differences in length.
-            if len(largest) != 0 and (len(smallest) / len(largest)) + 0.14 < threshold:
-                continue
-
-            score = cosine_similarity(largest, smallest)
+            largest, smallest = (k1, k2) if magnitudes[k1] >= magnitudes[k2] else (k2, k1)
+            score = cosine_similarity(
+              ntypes[largest], ntypes[smallest], magnitudes[largest], magnitudes[smallest],
+              threshold)
             if score >= threshold:
                 results[(k1, k2)] = score
 
 
 def process(results: _Scores) -> tuple[list[tuple[str, ...]], _Scores]:
-    graphs = defaultdict(nx.Graph)
-    for (p, q), score in results.items():
-        graphs[score].add_edge(p, q)
+    import networkx as nx
+
+    by_score = defaultdict(list)
+    for pair, score in results.items():
+        by_score[score].append(pair)
 
+    # Components are taken per score bucket, in linear time per bucket, so an exact-duplicate
+    # group keeps its score of 1 even when a member also matches other trees at a lower score.
     cliques = {}
-    for score, G in graphs.items():
-        for c in nx.find_cliques(G):
-            cliques[tuple(sorted(c))] = score  # type: ignore
+    for score, pairs in by_score.items():
+        G = nx.Graph(pairs)
+        for c in nx.connected_components(G):
+            cliques[tuple(sorted(c))] = score
 
     threshold = round(get_settings().grouping_threshold, 2)
     G = nx.Graph()
@@ -394,9 +569,11 @@ def update_collections(
     duplicates_coll.clear()
     scored_coll.clear()
 
+    # Group headings are formatted here so the panel doesn't rebuild them per redraw.
     for dgroup in duplicates:
         ditem = duplicates_coll.add()
         ditem.id_type = get_id_type(bl_data[dgroup[0]])
+        ditem.label_text = f"{len(dgroup)} Duplicates"
         for name in dgroup:
             i = ditem.group.add()
             i.name = name
@@ -404,10 +581,12 @@ def update_collections(
     if not scored:
         return
 
+    label = ID_TYPES[settings.id_type].label.title()
     for sgroup, score in scored.items():
         sitem = scored_coll.add()
         sitem.id_type = get_id_type(bl_data[sgroup[0]])
         sitem.score = score
+        sitem.label_text = f"{len(sgroup)} Similar {label} ({score:.1f}%)"
         for name in sgroup:
             i = sitem.group.add()
             i.name = name
@@ -427,30 +606,33 @@ def find_similar_and_duplicate_ntrees(id_type: str) -> None:
 
 
 def find_duplicate_images() -> None:
-    duplicates = []
-    images = [i for i in bpy.data.images if is_local_id(i)]
-    images.sort(key=get_image_props)
-    for _, raw_group in groupby(images, get_image_props):
-        group = [i.name for i in raw_group]
-        if len(group) > 1:
-            duplicates.append(group)
+    buckets = defaultdict(list)
+    for img in bpy.data.images:
+        if is_local_id(img):
+            buckets[get_image_props(img)].append(img.name)
 
+    duplicates = [group for group in buckets.values() if len(group) > 1]
     update_collections(bpy.data.images, duplicates)
 
 
 def find_duplicate_meshes() -> None:
-    meshes = [m for m in bpy.data.meshes if is_local_id(m)]
-    seen = set()
-    results = []
-    for m1 in meshes:
-        for m2 in meshes:
-            if {m1, m2} in seen or m1 == m2:
-                continue
 
-            if m1.unit_test_compare(mesh=m2) == 'Same':
-                results.append((m1, m2))
+    # `unit_test_compare()` is expensive, so only call it on meshes that share a cheap signature;
+    # meshes with different counts can never compare equal.
+
+    buckets = defaultdict(list)
+    for m in bpy.data.meshes:
+        if is_local_id(m):
+            buckets[(len(m.vertices), len(m.edges), len(m.polygons), len(m.loops))].append(m)
 
-            seen.add(frozenset((m1, m2)))
+    results = []
+    for bucket in buckets.values():
+        for i, m1 in enumerate(bucket):
+            for m2 in bucket[i + 1:]:
+                if m1.unit_test_compare(mesh=m2) == 'Same':
+                    results.append((m1, m2))
+
+    import networkx as nx
 
     G = nx.Graph()
     for group in results:
@@ -468,13 +650,13 @@ class DBU_OT_FindSimilarAndDuplicates(Operator):
     @classmethod
     def description(cls, context: Context, event: DBU_OT_FindSimilarAndDuplicates) -> str:
         id_type = get_settings().id_type
-        text = ID_TYPES[id_type].label
-        if ID_TYPES[id_type].is_ntree:
-            return f"Show {text} with the highest similarity to each other"
+        val = ID_TYPES[id_type]
+        if val.is_ntree:
+            return f"Show {val.label} with the highest similarity to each other"
         elif id_type == 'IMAGE':
-            return f"Show {text} with identical filepaths and settings"
+            return f"Show {val.label} with identical filepaths and settings"
         else:
-            return f"Show duplicate {text}"
+            return f"Show duplicate {val.label}"
 
     def invoke(self, context: Context, event: Event) -> set[str]:
         settings = get_settings()
@@ -484,8 +666,9 @@ class DBU_OT_FindSimilarAndDuplicates(Operator):
     def execute(self, context: Context) -> set[str]:
         settings = get_settings()
         id_type = settings.id_type
+        val = ID_TYPES[id_type]
 
-        if ID_TYPES[id_type].is_ntree:
+        if val.is_ntree:
             find_similar_and_duplicate_ntrees(id_type)
         elif id_type == 'IMAGE':
             find_duplicate_images()
@@ -493,8 +676,8 @@ class DBU_OT_FindSimilarAndDuplicates(Operator):
             find_duplicate_meshes()
 
         if not settings.duplicates and not settings.scored:
-            word = "similar" if ID_TYPES[id_type].is_ntree else "duplicate"
-            self.report({'INFO'}, f"No {word} {ID_TYPES[id_type].label} found")
+            word = "similar" if val.is_ntree else "duplicate"
+            self.report({'INFO'}, f"No {word} {val.label} found")
             settings.enabled = False
 
         return {'FINISHED'}
@@ -515,15 +698,17 @@ class DBU_OT_SimilarAndDuplicatesClearResults(Operator):
 # -------------------------------------------------------------------
 
 
-def merge_ids(duplicate_ids: Iterable[Iterable[bpy.types.ID]]) -> int:
-    to_remove = []
-    for target, *junk in duplicate_ids:
-        if not is_local_id(target) or any(not is_local_id(id_data) for id_data in junk):
-            continue
-        to_remove.extend(junk)
-        for id_data in junk:
-            id_data.user_remap(target)
+def merge_ids(duplicate_ids: Iterable[Sequence[bpy.types.ID]]) -> int:
+    groups = [g for g in duplicate_ids if all(map(is_local_id, g))]
+    to_remove = [junk for g in groups for junk in g[1:]]
 
+    for g in groups:
+        target = g[0]
+        for junk in g[1:]:
+            junk.user_remap(target)
+
+    # Each `user_remap()` is a full C-side scan of `bpy.data`; the single `batch_remove()` below
+    # keeps the actual removal linear.
     bpy.data.batch_remove(to_remove)
     return len(to_remove)
 
@@ -549,8 +734,9 @@ class DBU_OT_MergeDuplicates(Operator):
     def execute(self, context: Context) -> set[str]:
         settings = get_settings()
         id_type = settings.id_type
+        val = ID_TYPES[id_type]
 
-        bl_data = ID_TYPES[id_type].collection
+        bl_data = val.collection
         duplicate_ids = []
         for group in settings.duplicates:
             # Reporting that IDs are missing could give the false impression that stale data is
@@ -559,9 +745,30 @@ class DBU_OT_MergeDuplicates(Operator):
                 duplicate_ids.append(new_group)
 
         count = merge_ids(duplicate_ids)
+        _CONTENT_CACHE.clear()
         bpy.ops.scene.dbu_find_similar_and_duplicates()  # type: ignore
 
-        text = f"{ID_TYPES[id_type].label[:-1]}(s)" if id_type != 'MESH' else "mesh(s)"
+        text = f"{val.label[:-1]}(s)" if id_type != 'MESH' else "mesh(s)"
         self.report({'INFO'}, f"Cleared {count} {text}")
 
         return {'FINISHED'}
+
+
+# -------------------------------------------------------------------
+
+
+@bpy.app.handlers.persistent
+def _invalidate_content_cache(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph) -> None:
+    if _CONTENT_CACHE and any(
+      isinstance(u.id, (NodeTree, bpy.types.Material, bpy.types.Light))
+      for u in depsgraph.updates):
+        _CONTENT_CACHE.clear()
+
+
+def register_handlers() -> None:
+    bpy.app.handlers.depsgraph_update_post.append(_invalidate_content_cache)
+
+
+def unregister_handlers() -> None:
+    _CONTENT_CACHE.clear()
+    bpy.app.handlers.depsgraph_update_post.remove(_invalidate_content_cache)
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: GPL-2.0-or-later
 
-from collections.abc import Collection, Iterator, Sequence
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from itertools import chain
 from typing import cast
 
@@ -10,46 +10,82 @@ from bpy.types import ID, Context, Light, Material, Operator, ShaderNodeTree, Sp
 
 from ..constants import ID_TYPES
 
+UserMap = dict[ID, set[ID]]
 
-def get_users(subset: Sequence[ID], value_types: set[str]) -> list[ID]:
-    users = bpy.data.user_map(subset=subset, value_types=value_types)  # type: ignore
-    return list(chain(*users.values()))
+_USER_MAP_TYPES = {'MATERIAL', 'MESH', 'LIGHT', 'OBJECT', 'NODETREE'}
+_VALUE_CLASSES = {
+  'MATERIAL': bpy.types.Material,
+  'MESH': bpy.types.Mesh,
+  'LIGHT': bpy.types.Light,
+  'OBJECT': bpy.types.Object,
+  'NODETREE': bpy.types.NodeTree,
+}
 
 
-def get_users_recursive(subset: Sequence[ID], value_types: set[str]) -> Iterator[ID]:
-    value_types.add('NODETREE')
-    for user in get_users(subset, value_types):
-        if not hasattr(user, 'nodes'):
-            yield user
-        else:
-            yield from get_users_recursive([user], value_types)
+def build_user_map() -> UserMap:
+    # One full scan of Blender's ID tables; `get_users` then filters it locally instead of
+    # re-invoking `bpy.data.user_map` per query.
+    return bpy.data.user_map(value_types=_USER_MAP_TYPES)  # type: ignore
+
+
+def get_users(subset: Iterable[ID], value_types: set[str], user_map: UserMap) -> list[ID]:
+    classes = tuple(_VALUE_CLASSES[t] for t in value_types)
+    return [u for s in subset for u in user_map.get(s, ()) if isinstance(u, classes)]
+
+
+def get_users_recursive(
+  subset: Sequence[ID],
+  value_types: set[str],
+  user_map: UserMap,
+) -> Iterator[ID]:
+    value_types = value_types | {'NODETREE'}
+    frontier = list(subset)
+    visited = set(subset)
+
+    # Level-order walk over the cached map; the visited set prevents revisits along
+    # diamond-shaped user graphs.
+    while frontier:
+        next_frontier = []
+        for user in get_users(frontier, value_types, user_map):
+            if user in visited:
+                continue
+
+            visited.add(user)
+            if not hasattr(user, 'nodes'):
+                yield user
+            else:
+                next_frontier.append(user)
+
+        frontier = next_frontier
 
 
 def get_path_to_material(
   users: Sequence[Material | ShaderNodeTree],
-  obj_data_users: Collection[ID],
-  container: ShaderNodeTree | None = None,
+  referenced_mats: Collection[Material],
+  user_map: UserMap,
 ) -> tuple[Material, ShaderNodeTree | None]:
-    try:
-        mat = next(
-          u for u in users
-          if isinstance(u, Material) and any(m.user_of_id(u) for m in obj_data_users))
-        return mat, container
-    except StopIteration:
-        nested_users = get_users([users[0]], {'MATERIAL', 'NODETREE'})
-        return get_path_to_material(nested_users, obj_data_users, users[0])  # type: ignore
+    container = None
+    while True:
+        mat = next((u for u in users if u in referenced_mats), None)
+        if mat is not None:
+            return cast(Material, mat), container
+
+        container = cast(ShaderNodeTree, users[0])
+        users = get_users([container], {'MATERIAL', 'NODETREE'}, user_map)  # type: ignore
 
 
 def get_path_to_light(
   users: Sequence[Light | ShaderNodeTree],
-  container: ShaderNodeTree | None = None,
+  user_map: UserMap,
 ) -> tuple[Light, ShaderNodeTree | None]:
-    try:
-        light = next(u for u in users if isinstance(u, Light))
-        return light, container
-    except StopIteration:
-        nested_users = get_users([users[0]], {'LIGHT', 'NODETREE'})
-        return get_path_to_light(nested_users, users[0])  # type: ignore
+    container = None
+    while True:
+        light = next((u for u in users if isinstance(u, Light)), None)
+        if light is not None:
+            return light, container
+
+        container = cast(ShaderNodeTree, users[0])
+        users = get_users([container], {'LIGHT', 'NODETREE'}, user_map)  # type: ignore
 
 
 def get_geometry_node_group(
@@ -58,9 +94,8 @@ def get_geometry_node_group(
 ) -> bpy.types.GeometryNodeGroup:
     # Use `isinstance()` over `bl_idname` to satisfy Pyright
     nodes = [n for n in space.edit_tree.nodes if isinstance(n, bpy.types.GeometryNodeGroup)]
-    try:
-        node = next(n for n in nodes if n.node_tree == id_data)
-    except StopIteration:
+    node = next((n for n in nodes if n.node_tree == id_data), None)
+    if node is None:
         container = next(
           n.node_tree for n in nodes if n.node_tree and n.node_tree.contains_tree(id_data))
         space.path.append(container)
@@ -97,25 +132,30 @@ class DBU_OT_GoToDatablock(Operator):
         is_mat = id_type == 'MATERIAL'
         is_obj = 'OBJECT' in id_type
         shr_obj_users = geo_obj_users = subset = None
+        user_map = build_user_map()
 
         if id_type in {'MATERIAL', 'SHADER_NODETREE', 'IMAGE'}:
             if not is_mat:
-                subset = list(get_users_recursive([id_data], {'MATERIAL'}))
+                subset = list(get_users_recursive([id_data], {'MATERIAL'}, user_map))
             else:
                 subset = [id_data]
 
-            raw_mesh_users = get_users(subset, {'MESH'})
-            light_users = list(get_users_recursive([id_data], {'LIGHT'}))
+            raw_mesh_users = get_users(subset, {'MESH'}, user_map)
+            light_users = list(get_users_recursive([id_data], {'LIGHT'}, user_map))
 
-            shr_obj_users = get_users(raw_mesh_users + light_users, {'OBJECT'})
-            geo_obj_users = get_users([id_data], {'OBJECT'})
-            raw_obj_users = list(set(shr_obj_users + geo_obj_users))
+            shr_obj_users = get_users(raw_mesh_users + light_users, {'OBJECT'}, user_map)
+            geo_obj_users = get_users([id_data], {'OBJECT'}, user_map)
+
+            # `dict.fromkeys` dedupes in one allocation and, unlike a set, keeps the iteration
+            # order deterministic for everything downstream.
+            raw_obj_users = dict.fromkeys(chain(shr_obj_users, geo_obj_users))
         elif is_obj:
-            raw_obj_users = [id_data] + get_users([id_data], {'OBJECT'})
+            raw_obj_users = dict.fromkeys(chain([id_data], get_users([id_data], {'OBJECT'},
+              user_map)))
         else:
-            raw_obj_users = list(set(get_users_recursive([id_data], {'OBJECT'})))
+            raw_obj_users = dict.fromkeys(get_users_recursive([id_data], {'OBJECT'}, user_map))
 
-        raw_obj_users = cast(list[bpy.types.Object], raw_obj_users)
+        raw_obj_users = cast(Collection[bpy.types.Object], raw_obj_users)
         if not raw_obj_users:
             self.report({'WARNING'}, "No object users")
             return {'CANCELLED'}
@@ -125,7 +165,10 @@ class DBU_OT_GoToDatablock(Operator):
         node_name = self.node_name
         is_obj_data = ID_TYPES[id_type].is_object_data and not node_name
         view_layer = context.view_layer.objects
-        obj_users = [o for o in raw_obj_users if not o.library and o.name in view_layer]
+
+        # O(1) membership; `in` on a bpy prop-collection is a linear scan.
+        vl_names = {o.name for o in view_layer}
+        obj_users = [o for o in raw_obj_users if not o.library and o.name in vl_names]
 
         settings = getattr(context.scene, self.settings)
         if settings.select_object_users or (is_obj or is_obj_data) or not obj_users:
@@ -164,9 +207,14 @@ class DBU_OT_GoToDatablock(Operator):
 
             if subset:
                 if not is_mat:
-                    users = get_users([id_data], {'MATERIAL', 'NODETREE'})
-                    obj_data_users = [o.data for o in obj_users if o.data]
-                    mat, container = get_path_to_material(users, obj_data_users)  # type: ignore
+                    users = get_users([id_data], {'MATERIAL', 'NODETREE'}, user_map)
+
+                    # Built once so each hop in the path walk is a hash lookup per candidate.
+                    referenced_mats = {
+                      m for o in obj_users if o.data
+                      for m in getattr(o.data, 'materials', ()) if m}
+                    mat, container = get_path_to_material(
+                      users, referenced_mats, user_map)  # type: ignore
                 else:
                     mat = id_data
 
@@ -176,8 +224,8 @@ class DBU_OT_GoToDatablock(Operator):
                         obj.active_material_index = slots[mat.name].slot_index
                         break
             else:
-                users = get_users([id_data], {'LIGHT', 'NODETREE'})
-                light, container = get_path_to_light(users)  # type: ignore
+                users = get_users([id_data], {'LIGHT', 'NODETREE'}, user_map)
+                light, container = get_path_to_light(users, user_map)  # type: ignore
                 obj = next(o for o in obj_users if o.user_of_id(light))  # type: ignore
         else:
             obj = obj_users[0]
@@ -252,8 +300,8 @@ class DBU_OT_GoToDatablock(Operator):
                   n for n in nodes
                   if isinstance(n, bpy.types.ShaderNodeTexImage) and n.image == id_data)
 
-            for n in nodes:
-                n.select = n == node
+            # One C-side pass instead of a `select` RNA write per node.
+            nodes.foreach_set('select', [n == node for n in nodes])
 
             nodes.active = node
             bpy.ops.view2d.reset()
@@ -283,13 +331,10 @@ class DBU_OT_RehideObjectsUsers(Operator):
         if not unhidden_objects:
             return {'CANCELLED'}
 
+        objects = bpy.data.objects
         for obj_item in unhidden_objects:
-            try:
-                obj = bpy.data.objects[obj_item.name]
-            except KeyError:
-                continue
-
-            obj.hide_set(True)
+            if (obj := objects.get(obj_item.name)) is not None:
+                obj.hide_set(True)
 
         unhidden_objects.clear()
 
@@ -1,21 +1,39 @@
 # SPDX-License-Identifier: GPL-2.0-or-later
 
+from collections import defaultdict
+from functools import lru_cache
 from typing import cast
 
 import bpy
 from bpy.props import IntProperty
 from bpy.types import ID, Context, EnumProperty, Operator
 
-from ..constants import ID_TYPES, get_id_type
+from ..constants import ID_TYPES, OBJECT_DATA_TYPES, get_id_type
 from ..properties import DBU_PG_ParentItem, DBU_PG_UserItem, DBU_PG_UserMapSettings
 
 _EXCLUDED_VALUE_TYPES = {'COLLECTION', 'WINDOWMANAGER', 'WORKSPACE'}
+_NODE_ID_PROPS = ('node_tree', 'image', 'material', 'object')
 
 
 def get_settings() -> DBU_PG_UserMapSettings:
     return bpy.context.scene.dbu_users_settings  # type: ignore
 
 
+# These never change within a session, but the RNA walks behind them aren't free; resolved
+# lazily since the property group isn't registered at import time.
+@lru_cache(maxsize=1)
+def _static_enums() -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+    keyingset_prop = cast(
+      EnumProperty, bpy.types.KeyingSetPath.bl_rna.properties['id_type'])
+    id_type_prop = cast(
+      EnumProperty, DBU_PG_UserMapSettings.bl_rna.properties['id_type'])
+    return (
+      frozenset(e for e in DBU_PG_UserMapSettings.__annotations__ if e.isupper()),
+      frozenset(keyingset_prop.enum_items.keys()),
+      frozenset(id_type_prop.enum_items.keys()),
+    )
+
+
 class DBU_OT_UserMap(Operator):
     bl_idname = "scene.dbu_user_map"
     bl_label = "Show Data-Block Users"
@@ -23,26 +41,37 @@ class DBU_OT_UserMap(Operator):
     bl_options = {'INTERNAL', 'UNDO'}
 
     @staticmethod
-    def get_node_names(nodes: bpy.types.Nodes, parent: DBU_PG_ParentItem) -> list[str]:
+    def get_node_names(
+      nodes: bpy.types.Nodes,
+      parent: DBU_PG_ParentItem,
+      indices: dict[ID, dict[ID, list[str]]],
+    ) -> list[str]:
         id_type = parent.id_type
 
-        if 'NODETREE' in id_type:
-            prop = 'node_tree'
-        elif 'IMAGE' in id_type:
-            prop = 'image'
-        elif 'MATERIAL' in id_type:
-            prop = 'material'
-        elif 'OBJECT' in id_type and not ID_TYPES[id_type].is_object_data:
-            prop = 'object'
-        else:
+        if not (
+          'NODETREE' in id_type or 'IMAGE' in id_type or 'MATERIAL' in id_type
+          or ('OBJECT' in id_type and id_type not in OBJECT_DATA_TYPES)):
             return []
 
+        # The same node tree turns up as a user under many parents; index its nodes by
+        # referenced ID once instead of rescanning them per parent.
+        owner = nodes.id_data
+        if (index := indices.get(owner)) is None:
+            index = indices[owner] = defaultdict(list)
+            for n in nodes:
+                ids = {v for p in _NODE_ID_PROPS if (v := getattr(n, p, None)) is not None}
+                ids.update(
+                  v for i in n.inputs
+                  if not i.is_linked and isinstance(v := getattr(i, 'default_value', None), ID))
+                for v in ids:
+                    index[v].append(n.name)
+
         id_data = ID_TYPES[id_type].collection[parent.name]
-        node_names = [
-          n.name for n in nodes if getattr(n, prop, None) == id_data or any(
-          not i.is_linked and getattr(i, 'default_value', None) == id_data for i in n.inputs)]
+        node_names = index.get(id_data, [])
+
+        if len(node_names) > 1:
+            node_names.sort()
 
-        node_names.sort()
         return node_names
 
     @classmethod
@@ -52,36 +81,56 @@ class DBU_OT_UserMap(Operator):
       user: ID,
       precomputed: dict[ID, set[ID]],
       ancestors: set[ID],
+      indices: dict[ID, dict[ID, list[str]]],
+      id_types: dict[ID, str],
     ) -> None:
         settings = get_settings()
         user_map = settings.user_map
+        show_obj_data = settings.OBJECT
 
-        name = user.name
-        id_type = get_id_type(user)
+        # Depth-first with an explicit stack; 1-tuples mark where to unwind the shared ancestor
+        # set, so no `ancestors | {user}` copy is made per level.
+        stack: list[tuple] = [(parent, user)]
+        while stack:
+            frame = stack.pop()
+            if len(frame) == 1:
+                ancestors.remove(frame[0])
+                continue
 
-        if not settings.OBJECT and ID_TYPES[id_type].is_object_data:
-            return
+            parent, user = frame
+            name = user.name
 
-        as_parent: DBU_PG_ParentItem = user_map.add()
-        as_parent.name = name
-        as_parent.id_type = id_type
+            # Shared IDs are revisited under many parents; resolve their type string once.
+            if (id_type := id_types.get(user)) is None:
+                id_type = id_types[user] = get_id_type(user)
+
+            if not show_obj_data and id_type in OBJECT_DATA_TYPES:
+                continue
+
+            as_parent: DBU_PG_ParentItem = user_map.add()
+            as_parent.name = name
+            as_parent.id_type = id_type
 
-        as_user: DBU_PG_UserItem = parent.users.add()
-        as_user.name = name
-        as_user.id_type = id_type
-        as_user.as_parent_idx = len(user_map) - 1
+            as_user: DBU_PG_UserItem = parent.users.add()
+            as_user.name = name
+            as_user.id_type = id_type
+            as_user.as_parent_idx = len(user_map) - 1
 
-        if user in ancestors:
-            return
+            if user in ancestors:
+                continue
 
-        if nodes := getattr(getattr(user, 'node_tree', user), 'nodes', None):
-            for name in cls.get_node_names(nodes, parent):
-                item = as_user.node_names.add()
-                item.name = name
+            if nodes := getattr(getattr(user, 'node_tree', user), 'nodes', None):
+                for name in cls.get_node_names(nodes, parent, indices):
+                    item = as_user.node_names.add()
+                    item.name = name
 
-        for u in precomputed[user]:
-            if u != user:
-                cls.add_users(as_parent, u, precomputed, ancestors | {user})
+            # Leaves are the common case; skip the ancestor bookkeeping when there is nothing
+            # to descend into.
+            users_of_user = precomputed[user]
+            if users_of_user and not (len(users_of_user) == 1 and user in users_of_user):
+                ancestors.add(user)
+                stack.append((user,))
+                stack.extend((as_parent, u) for u in users_of_user if u != user)
 
     def execute(self, context: Context) -> set[str]:
         settings = get_settings()
@@ -94,17 +143,18 @@ class DBU_OT_UserMap(Operator):
         parent_map.clear()
         settings.user_map.clear()
 
-        setting_enums = {e for e in dir(settings) if e.isupper()}
+        setting_enums, keyingset_enums, id_type_enums = _static_enums()
         value_types = {e for e in setting_enums if getattr(settings, e)}
         if settings.others:
-            prop = cast(EnumProperty, bpy.types.KeyingSetPath.bl_rna.properties['id_type'])
-            value_types.update(set(prop.enum_items.keys()) - setting_enums)
+            value_types.update(keyingset_enums - setting_enums)
 
         value_types -= _EXCLUDED_VALUE_TYPES
-        prop = cast(EnumProperty, settings.bl_rna.properties['id_type'])
-        key_types = value_types.union(prop.enum_items.keys())
-        precomputed = bpy.data.user_map(
-          key_types=key_types, value_types=value_types)  # type: ignore
+        key_types = value_types | id_type_enums
+        # Walked users outside key_types must read as empty rather than raise KeyError.
+        precomputed = defaultdict(set, bpy.data.user_map(
+          key_types=key_types, value_types=value_types))  # type: ignore
+        indices: dict[ID, dict[ID, list[str]]] = {}
+        id_types: dict[ID, str] = {}
 
         for temp_parent in parents:
             name = temp_parent.name
@@ -113,10 +163,11 @@ class DBU_OT_UserMap(Operator):
             as_parent = parent_map.add()
             as_parent.name = name
             as_parent.id_type = id_type
+            as_parent.panel_key = id_type + name
 
             id_data = ID_TYPES[id_type].collection[name]
             for user in precomputed[id_data]:
-                self.add_users(as_parent, user, precomputed, {id_data})
+                self.add_users(as_parent, user, precomputed, {id_data}, indices, id_types)
 
         return {'FINISHED'}
 
@@ -147,14 +198,15 @@ class DBU_OT_UserMapAddAll(Operator):
         parents = settings.parents
         bl_data = ID_TYPES[settings.id_type].collection
 
+        existing = {(p.name, p.id_type) for p in parents}
         for id_data in bl_data:
             name = id_data.name
             id_type = get_id_type(id_data)
 
-            if name in parents:
-                if any((p.name, p.id_type) == (name, id_type) for p in parents):
-                    continue
+            if (name, id_type) in existing:
+                continue
 
+            existing.add((name, id_type))
             parent = parents.add()
             parent.name = name
             parent.id_type = id_type
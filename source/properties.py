@@ -48,7 +48,7 @@ def add_parent_item(self: DBU_PG_UserMapSettings, context: Context) -> None:
     id_type = get_id_type(bl_data[id_name])
 
     if id_name in parents:
-        if any((p.name, p.id_type) == (id_name, id_type) for p in parents):
+        if any(p.id_type == id_type and p.name == id_name for p in parents):
             self.id_name = ""
             return
 
@@ -81,6 +81,7 @@ class DBU_PG_GroupItem(PropertyGroup):
     group: CollectionProperty(type=DBU_PG_Item)
     id_type: StringProperty()
     score: FloatProperty()
+    label_text: StringProperty()
 
 
 class DBU_PG_UserItem(PropertyGroup):
@@ -92,6 +93,7 @@ class DBU_PG_UserItem(PropertyGroup):
 class DBU_PG_ParentItem(PropertyGroup):
     id_type: StringProperty()
     users: CollectionProperty(type=DBU_PG_UserItem)
+    panel_key: StringProperty()
 
 
 class DBU_PG_FindSimilarSettings(PropertyGroup):
@@ -2,12 +2,39 @@
 
 # type: ignore
 
+from functools import lru_cache
+
 import bpy
 from bpy.types import Context, Panel, UILayout
 from bpy.utils import register_class, unregister_class
 
-from .constants import ID_TYPES
-from .properties import DBU_PG_GroupItem, DBU_PG_ParentItem, DBU_PG_UserItem
+from .constants import ID_TYPES, OBJECT_DATA_TYPES
+from .properties import (
+  DBU_PG_GroupItem,
+  DBU_PG_ParentItem,
+  DBU_PG_UserItem,
+  DBU_PG_UserMapSettings,
+)
+
+
+# The enum keys without an explicit filter toggle never change within a session; lazy since
+# the property group isn't registered at import time.
+@lru_cache(maxsize=1)
+def _other_enums() -> tuple[str, ...]:
+    settings_props = frozenset(DBU_PG_UserMapSettings.bl_rna.properties.keys())
+    enums = bpy.types.KeyingSetPath.bl_rna.properties['id_type'].enum_items.keys()
+    return tuple(e for e in enums if e not in settings_props)
+
+
+# id_type -> (title-cased label, is_ntree, icon, find-button text); draw() runs on every UI
+# event, so the string work is done once per session.
+_REHIDE_ICONS = ('HIDE_ON', 'HIDE_OFF')
+
+_SIMILAR_CACHE = {
+  k: (
+  v.label.title(), v.is_ntree, v.icon,
+  "Find Similar and Duplicates" if v.is_ntree else "Find Duplicates")
+  for k, v in ID_TYPES.items()}
 
 
 class ScenePropertiesPanel:
@@ -24,7 +51,7 @@ class DBU_PT_SimilarAndDuplicates(ScenePropertiesPanel, Panel):
     @staticmethod
     def draw_group(layout: UILayout, item: DBU_PG_GroupItem) -> None:
         id_type = item.id_type
-        icon = ID_TYPES[id_type].icon
+        icon = _SIMILAR_CACHE[id_type][2]
 
         col = layout.box().column()
         for i in item.group:
@@ -46,16 +73,17 @@ class DBU_PT_SimilarAndDuplicates(ScenePropertiesPanel, Panel):
 
         scene = context.scene
         settings = scene.dbu_similar_settings
+
+        # Each settings read crosses into RNA; fetch the repeated ones once per redraw.
         id_type = settings.id_type
+        enabled = settings.enabled
+        select_object_users = settings.select_object_users
 
-        is_ntree = ID_TYPES[id_type].is_ntree
-        text = ID_TYPES[id_type].label
-        label = text.title()
+        _, is_ntree, _, find_text = _SIMILAR_CACHE[id_type]
 
         row = layout.row(align=True)
-        text = "Find Similar and Duplicates" if is_ntree else "Find Duplicates"
-        row.operator("scene.dbu_find_similar_and_duplicates", text=text)
-        if settings.enabled:
+        row.operator("scene.dbu_find_similar_and_duplicates", text=find_text)
+        if enabled:
             row.operator("scene.dbu_similar_and_duplicates_clear_results", text="", icon='X')
 
         layout.prop(settings, "id_type")
@@ -73,18 +101,20 @@ class DBU_PT_SimilarAndDuplicates(ScenePropertiesPanel, Panel):
         row = layout.row()
         row.prop(settings, "select_object_users")
         sub = row.row()
-        sub.active = settings.select_object_users
-        rehide_icon = 'HIDE_OFF' if settings.unhidden_objects else 'HIDE_ON'
+        sub.active = select_object_users
+        rehide_icon = _REHIDE_ICONS[bool(settings.unhidden_objects)]
         op = sub.operator("scene.dbu_rehide_object_users", text="", icon=rehide_icon)
         op.settings = 'dbu_similar_settings'
 
-        if not settings.enabled:
+        if not enabled:
             return
 
         if duplicates_coll := settings.duplicates:
             for ditem in duplicates_coll:
                 layout.separator(factor=0.1)
-                layout.label(text=f"{len(ditem.group)} Duplicates", icon='ERROR')
+                # Results persisted by older versions deserialize without a label.
+                text = ditem.label_text or f"{len(ditem.group)} Duplicates"
+                layout.label(text=text, icon='ERROR')
                 self.draw_group(layout, ditem)
 
             layout.separator(factor=0.1)
@@ -94,16 +124,21 @@ class DBU_PT_SimilarAndDuplicates(ScenePropertiesPanel, Panel):
 
         for sitem in settings.scored:
             layout.separator(factor=0.1)
-            layout.label(
-              text=f"{len(sitem.group)} Similar {label} ({sitem.score:.1f}%)",
-              icon='INFO',
-            )
+            text = sitem.label_text or (
+              f"{len(sitem.group)} Similar {ID_TYPES[sitem.id_type].label.title()}"
+              f" ({sitem.score:.1f}%)")
+            layout.label(text=text, icon='INFO')
             self.draw_group(layout, sitem)
 
 
 _NODE_NAME_SPACING = 3
 _INDENT = 0.087
 _INITIAL_INDENT_OFFSET = 0.026
+_NODE_NAME_OFFSET = 0.0574
+
+# Indent factors indexed by depth; deeper levels than the table fall back to arithmetic.
+_INDENTS = (0.0, _INDENT + _INITIAL_INDENT_OFFSET) + tuple(_INDENT * d for d in range(2, 32))
+_INDENTS_PLUS = tuple(i + _NODE_NAME_OFFSET for i in _INDENTS)
 
 
 class DBU_PT_UserMap(ScenePropertiesPanel, Panel):
@@ -138,41 +173,61 @@ class DBU_PT_UserMap(ScenePropertiesPanel, Panel):
         layout.separator()
         col = layout.column(align=True)
 
-        for n in node_names:
+        user_name = user.name
+        user_type = user.id_type
+        last_idx = len(node_names) - 1
+        fac_last = _NODE_NAME_SPACING / 2
+
+        for i, n in enumerate(node_names):
             row = col.row(align=True)
             row.alignment = 'LEFT'
 
-            fac = _NODE_NAME_SPACING if n != node_names[-1] else _NODE_NAME_SPACING / 2
+            fac = _NODE_NAME_SPACING if i != last_idx else fac_last
             col.separator(factor=fac)
 
-            op = row.operator("scene.dbu_go_to_datablock", text=n.name, emboss=False)
-            op.id_name = user.name
-            op.id_type = user.id_type
-            op.node_name = n.name
+            name = n.name
+            op = row.operator("scene.dbu_go_to_datablock", text=name, emboss=False)
+            op.id_name = user_name
+            op.id_type = user_type
+            op.node_name = name
 
     @classmethod
-    def draw_users(cls, layout: UILayout, parent: DBU_PG_ParentItem, depth: int = 1) -> None:
-        settings = bpy.context.scene.dbu_users_settings
-        user_map = settings.user_map
-        object_contents = settings.object_contents
-
-        indent = _INDENT + _INITIAL_INDENT_OFFSET if depth == 1 else _INDENT * depth
-
-        for user in parent.users:
+    def draw_users(
+      cls,
+      layout: UILayout,
+      parent: DBU_PG_ParentItem,
+      user_map: bpy.types.bpy_prop_collection,
+      object_contents: bool,
+    ) -> None:
+
+        # Depth-first over an explicit stack; recursion re-resolved the settings per level and
+        # panels redraw on every UI event. Children are pushed reversed to keep draw order.
+        stack = [(user, 1) for user in reversed(parent.users)]
+        while stack:
+            user, depth = stack.pop()
             idx = user.as_parent_idx
 
-            if not object_contents and ID_TYPES[user.id_type].is_object_data:
-                cls.draw_users(layout, user_map[idx], depth)
+            if not object_contents and user.id_type in OBJECT_DATA_TYPES:
+                stack.extend((u, depth) for u in reversed(user_map[idx].users))
                 continue
 
+            if depth < len(_INDENTS):
+                indent = _INDENTS[depth]
+                name_indent = _INDENTS_PLUS[depth]
+            else:
+                indent = _INDENT * depth
+                name_indent = indent + _NODE_NAME_OFFSET
+
             split = layout.split(factor=indent)
             split.separator()
             cls.draw_datablock(split, user)
 
-            split = layout.split(factor=indent + 0.0574)
-            cls.draw_node_names(split, user)
+            # Most users have no node names; don't build the second split for them.
+            if user.node_names:
+                split = layout.split(factor=name_indent)
+                cls.draw_node_names(split, user)
 
-            cls.draw_users(layout, user_map[idx], depth + 1)
+            stack.extend((u, depth + 1) for u in reversed(user_map[idx].users))
 
     def draw_header(self, context: Context) -> None:
         layout = self.layout
@@ -184,6 +239,8 @@ class DBU_PT_UserMap(ScenePropertiesPanel, Panel):
 
         settings = context.scene.dbu_users_settings
         parent_map = settings.parent_map
+        id_type = settings.id_type
+        select_object_users = settings.select_object_users
 
         split = layout.split(factor=(65 / context.area.width), align=True)
         split.popover("SCENE_PT_DBU_user_map_filter", icon='FILTER')
@@ -207,19 +264,19 @@ class DBU_PT_UserMap(ScenePropertiesPanel, Panel):
                 box.scale_y = 0.75
                 box.emboss = 'NONE'
                 for i, parent in enumerate(parents):
-                    name = parent.name
-                    id_type = parent.id_type
+                    parent_name = parent.name
+                    parent_id_type = parent.id_type
 
                     split = box.split(factor=0.9)
                     row = split.row()
                     row.alignment = 'LEFT'
                     op = row.operator(
                       "scene.dbu_go_to_datablock",
-                      text=name,
-                      icon=ID_TYPES[id_type].icon,
+                      text=parent_name,
+                      icon=ID_TYPES[parent_id_type].icon,
                     )
-                    op.id_name = name
-                    op.id_type = id_type
+                    op.id_name = parent_name
+                    op.id_type = parent_id_type
                     row = split.row()
                     row.alignment = 'RIGHT'
                     op = row.operator("scene.dbu_user_map_remove", text="", icon='X')
@@ -231,7 +288,7 @@ class DBU_PT_UserMap(ScenePropertiesPanel, Panel):
           settings,
           "id_name",
           bpy.data,
-          ID_TYPES[settings.id_type]._collection,
+          ID_TYPES[id_type]._collection,
           text="",
           icon='BLANK1',
         )
@@ -245,8 +302,8 @@ class DBU_PT_UserMap(ScenePropertiesPanel, Panel):
         row.alignment = 'CENTER'
         row.prop(settings, "select_object_users")
         sub = row.row()
-        sub.active = settings.select_object_users
-        rehide_icon = 'HIDE_OFF' if settings.unhidden_objects else 'HIDE_ON'
+        sub.active = select_object_users
+        rehide_icon = _REHIDE_ICONS[bool(settings.unhidden_objects)]
         op = sub.operator("scene.dbu_rehide_object_users", text="", icon=rehide_icon)
         op.settings = 'dbu_users_settings'
 
@@ -255,17 +312,29 @@ class DBU_PT_UserMap(ScenePropertiesPanel, Panel):
 
         layout.separator(factor=0.5)
 
+        user_map = settings.user_map
+        object_contents = settings.object_contents
+
+        # One shared parent layout plus local bindings; with many parents the per-iteration
+        # method lookups add up on redraw.
+        parents_col = layout.column()
+        layout_panel = parents_col.panel
+        draw_datablock = self.draw_datablock
+        draw_users = self.draw_users
+
         for parent in parent_map:
-            header, panel = layout.panel(parent.id_type + parent.name, default_closed=True)
-            self.draw_datablock(header, parent)
+            # Results persisted by older versions deserialize without a panel key.
+            panel_key = parent.panel_key or parent.id_type + parent.name
+            header, panel = layout_panel(panel_key, default_closed=True)
+            draw_datablock(header, parent)
 
             if not panel:
                 continue
 
             if parent.users:
-                self.draw_users(panel, parent)
+                draw_users(panel, parent, user_map, object_contents)
             else:
-                split = panel.split(factor=_INDENT + _INITIAL_INDENT_OFFSET)
+                split = panel.split(factor=_INDENTS[1])
                 split.separator()
                 row = split.row()
                 row.active = False
@@ -281,16 +350,16 @@ class DBU_PT_UserMapFilter(ScenePropertiesPanel, Panel):
     @staticmethod
     def draw_user_type(layout: UILayout, prop_name: str) -> None:
         settings = bpy.context.scene.dbu_users_settings
+        val = ID_TYPES.get(prop_name)
 
         if prop_name not in {'OBJECT', 'object_contents'}:
             if prop_name == 'others':
-                enums = bpy.types.KeyingSetPath.bl_rna.properties['id_type'].enum_items.keys()
-                if not any([ID_TYPES[e].collection for e in enums if e not in dir(settings)]):
+                if not any(ID_TYPES[e].collection for e in _other_enums()):
                     return
-            elif not ID_TYPES[prop_name].collection:
+            elif not val.collection:
                 return
 
-        icon = ID_TYPES[prop_name].icon if prop_name in ID_TYPES else 'BLANK1'
+        icon = val.icon if val is not None else 'BLANK1'
 
         row = layout.row()
         row.label(icon=icon)